@@ -1,7 +1,9 @@
+import os
+import re
 import string
 import subprocess
 import zipfile
-from collections import defaultdict
+from collections import Counter
 from pathlib import Path
 
 import typer
@@ -24,13 +26,14 @@ def igi1_callback(ctx: typer.Context) -> None:
     name="convert-all-res",
     short_help="Convert all .res files found in source_dir to .zip or .json files",
 )
-def igi1_convert_all_res(dry: bool = False) -> None:
-    config = Config.model_validate_file()
+def igi1_convert_all_res(ctx: typer.Context, dry: bool = False, workers: int = utils.DEFAULT_WORKERS) -> None:
+    config: Config = ctx.obj
     utils.convert_all(
         reader=config.igi1.read_all_res(),
         parser=formats.RES,
         router={"*.zip": config.igi1.unpack_dir, "*.json": config.igi1.target_dir},
         dry=dry,
+        workers=workers,
     )
 
 
@@ -38,13 +41,14 @@ def igi1_convert_all_res(dry: bool = False) -> None:
     name="convert-all-wav",
     short_help="Convert all .wav files found in source_dir and unpack_dir to regular .wav files",
 )
-def igi1_convert_all_wav(dry: bool = False) -> None:
-    config = Config.model_validate_file()
+def igi1_convert_all_wav(ctx: typer.Context, dry: bool = False, workers: int = utils.DEFAULT_WORKERS) -> None:
+    config: Config = ctx.obj
     utils.convert_all(
         reader=config.igi1.read_all_wav(),
         parser=formats.WAV,
         router={"*": config.igi1.target_dir},
         dry=dry,
+        workers=workers,
     )
 
 
@@ -52,13 +56,14 @@ def igi1_convert_all_wav(dry: bool = False) -> None:
     name="convert-all-qvm",
     short_help="Convert all .qvm files found in source_dir to .qsc file",
 )
-def igi1_convert_all_qvm(dry: bool = False) -> None:
-    config = Config.model_validate_file()
+def igi1_convert_all_qvm(ctx: typer.Context, dry: bool = False, workers: int = utils.DEFAULT_WORKERS) -> None:
+    config: Config = ctx.obj
     utils.convert_all(
         reader=config.igi1.read_all_qvm(),
         parser=formats.QVM,
         router={"*": config.igi1.target_dir},
         dry=dry,
+        workers=workers,
     )
 
 
@@ -66,14 +71,14 @@ def igi1_convert_all_qvm(dry: bool = False) -> None:
     name="convert-all-tex",
     short_help="Convert all .tex, .spr and .pic files found in source_dir and unpack_dir to .tga files",
 )
-def igi1_convert_all_tex(dry: bool = False) -> None:
-    config = Config.model_validate_file()
-
+def igi1_convert_all_tex(ctx: typer.Context, dry: bool = False, workers: int = utils.DEFAULT_WORKERS) -> None:
+    config: Config = ctx.obj
     utils.convert_all(
         reader=config.igi1.read_all_tex(),
         parser=formats.TEX,
         router={"*": config.igi1.target_dir},
         dry=dry,
+        workers=workers,
     )
 
 
@@ -81,15 +86,15 @@ def igi1_convert_all_tex(dry: bool = False) -> None:
     name="convert-all",
     short_help="Convert all known formats found in source_dir",
 )
-def igi1_convert_all() -> None:
+def igi1_convert_all(ctx: typer.Context, workers: int = utils.DEFAULT_WORKERS) -> None:
     typer.secho("Converting `.res`...", fg="green")
-    igi1_convert_all_res(dry=False)
+    igi1_convert_all_res(ctx, dry=False, workers=workers)
     typer.secho("Converting `.wav`...", fg="green")
-    igi1_convert_all_wav(dry=False)
+    igi1_convert_all_wav(ctx, dry=False, workers=workers)
     typer.secho("Converting `.qvm`...", fg="green")
-    igi1_convert_all_qvm(dry=False)
+    igi1_convert_all_qvm(ctx, dry=False, workers=workers)
     typer.secho("Converting `.tex`...", fg="green")
-    igi1_convert_all_tex(dry=False)
+    igi1_convert_all_tex(ctx, dry=False, workers=workers)
 
 
 @igi1_app.command(
@@ -97,44 +102,44 @@ def igi1_convert_all() -> None:
     short_help="Group files in source_dir and unpack_dir by extension and show counts",
     hidden=True,
 )
-def igi1_extensions() -> None:
-    config = Config.model_validate_file()
+def igi1_extensions(ctx: typer.Context) -> None:
+    config: Config = ctx.obj
+
+    source_paths = [os.path.splitext(path) for path in utils.iter_files(config.igi1.source_dir)]  # noqa: PTH122
+    source_mtp_roots = {path_root for path_root, path_suffix in source_paths if path_suffix == ".mtp"}
 
-    counter = defaultdict(lambda: {"source": 0, "unpack": 0})
+    def source_format_name(path_root: str, path_suffix: str) -> str:
+        if path_suffix != ".dat":
+            return f"`{path_suffix}`"
 
-    for path in config.igi1.source_dir.glob("**/*"):
-        if not path.is_file():
-            continue
+        if path_root in source_mtp_roots:
+            return "`.dat` (mtp)"
 
-        if path.suffix != ".dat":
-            format_name = f"`{path.suffix}`"
-        elif path.with_suffix(".mtp").exists():
-            format_name = "`.dat` (mtp)"
-        else:
-            format_name = "`.dat` (graph)"
+        return "`.dat` (graph)"
 
-        counter[format_name]["source"] += 1
+    source_counter = Counter(source_format_name(path_root, path_suffix) for path_root, path_suffix in source_paths)
+    unpack_counter = Counter()
 
-    for path in config.igi1.unpack_dir.glob("**/*.zip"):
+    for path in utils.iter_files(config.igi1.unpack_dir, suffix=".zip"):
         with zipfile.ZipFile(path, "r") as zip_file:
-            for file_info in zip_file.infolist():
-                format_name = f"`{Path(file_info.filename).suffix}`"
-                counter[format_name]["unpack"] += 1
+            unpack_counter.update(f"`{os.path.splitext(name)[1]}`" for name in zip_file.namelist())  # noqa: PTH122
 
     results: list[tuple[str, int, int, int]] = [
-        (extension, counts["source"] + counts["unpack"], counts["source"], counts["unpack"])
-        for extension, counts in sorted(
-            counter.items(), key=lambda item: item[1]["source"] + item[1]["unpack"], reverse=True
-        )
+        (extension, total, source_counter[extension], unpack_counter[extension])
+        for extension, total in (source_counter + unpack_counter).most_common()
     ]
 
-    typer.echo(
-        f"| {'Extension':<15} | {'Total':<15} | {'Source':<15} | {'Unpack':<15} |\n"
-        f"|-{'-' * 15}-|-{'-' * 15}-|-{'-' * 15}-|-{'-' * 15}-|"
+    lines = [
+        f"| {'Extension':<15} | {'Total':<15} | {'Source':<15} | {'Unpack':<15} |",
+        f"|-{'-' * 15}-|-{'-' * 15}-|-{'-' * 15}-|-{'-' * 15}-|",
+    ]
+
+    lines.extend(
+        f"| {extension:<15} | {total:<15} | {source:<15} | {unpack:<15} |"
+        for extension, total, source, unpack in results
     )
 
-    for extension, total, source, unpack in results:
-        typer.echo(f"| {extension:<15} | {total:<15} | {source:<15} | {unpack:<15} |")
+    typer.echo("\n".join(lines))
 
 
 app = typer.Typer(add_completion=False)
@@ -151,7 +156,7 @@ def callback(
         raise typer.Exit(0)
 
     try:
-        Config.model_validate_file()
+        ctx.obj = Config.model_validate_file()
     except FileNotFoundError:
         typer.echo(
             f"{typer.style('An error occurred!', fg='yellow')}\n"
@@ -187,17 +192,19 @@ def callback(
 )
 def printable(src: Path, min_length: int = 5, charset: str = string.printable) -> None:
     data = src.read_bytes()
-    word = bytearray()
-
-    charset = charset.encode()
-
-    for byte in data:
-        if byte in charset:
-            word.append(byte)
-        else:
-            if len(word) >= min_length:
-                typer.echo(word.decode())
-            word.clear()
+    charset = re.escape(charset.encode())
+
+    if not charset:
+        # Every byte terminates an empty series
+        words = [""] * len(data) if min_length <= 0 else []
+    else:
+        # One series per terminating byte: it starts after a non-charset byte and ends right before the next one.
+        # A series still open at the end of file is not terminated, so it is not reported.
+        pattern = re.compile(b"(?<![%b])[%b]{%d,}+(?=[^%b])" % (charset, charset, max(min_length, 0), charset))
+        words = [match.group().decode() for match in pattern.finditer(data)]
+
+    if words:
+        typer.echo("\n".join(words))
 
 
 @app.command(
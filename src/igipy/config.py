@@ -1,3 +1,4 @@
+import stat
 from pathlib import Path
 from typing import ClassVar, Self
 
@@ -12,11 +13,14 @@ class Config(BaseModel):
 
     @classmethod
     def model_validate_file(cls) -> Self:
-        if not cls.path.exists():
+        try:
+            path_stat = cls.path.lstat()
+        except FileNotFoundError:
             cls.path.parent.mkdir(parents=True, exist_ok=True)
             cls.path.write_text(cls.model_construct().model_dump_json(indent=2))
+            path_stat = cls.path.lstat()
 
-        if not cls.path.is_file(follow_symlinks=False):
+        if not stat.S_ISREG(path_stat.st_mode):
             raise FileNotFoundError(f"{cls.path.as_posix()} isn't a file")
 
-        return cls.model_validate_json(cls.path.read_text())
+        return cls.model_validate_json(cls.path.read_bytes())
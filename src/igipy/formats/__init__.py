@@ -1,10 +1,35 @@
+import importlib
+from typing import TYPE_CHECKING
+
 __all__ = ["MEF", "QSC", "QVM", "RES", "TEX", "TGA", "WAV", "FileModel"]
 
 from .base import FileModel
-from .mef import MEF
-from .qsc import QSC
-from .qvm import QVM
-from .res import RES
-from .tex import TEX
-from .tga import TGA
-from .wav import WAV
+
+if TYPE_CHECKING:
+    from .mef import MEF
+    from .qsc import QSC
+    from .qvm import QVM
+    from .res import RES
+    from .tex import TEX
+    from .tga import TGA
+    from .wav import WAV
+
+lazy_imports: dict[str, str] = {
+    "MEF": ".mef",
+    "QSC": ".qsc",
+    "QVM": ".qvm",
+    "RES": ".res",
+    "TEX": ".tex",
+    "TGA": ".tga",
+    "WAV": ".wav",
+}
+
+
+def __getattr__(name: str) -> type[FileModel]:
+    """Import format modules on first access, so a command only pays for the formats it uses"""
+    if name not in lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(lazy_imports[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,6 @@
 from io import BytesIO
 from struct import Struct
-from typing import ClassVar, Self
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel
 
@@ -22,20 +22,40 @@ class FileIgnored(NotImplementedError):  # noqa: N818
 
 class StructModel(BaseModel):
     struct: ClassVar[Struct] = None
+    struct_fields: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.struct_fields = tuple(cls.__pydantic_fields__)
 
     @classmethod
     def model_validate_stream(cls, stream: BytesIO) -> Self:
-        cls_fields = cls.__pydantic_fields__.keys()
         cls_values = cls.struct.unpack(stream.read(cls.struct.size))
         # noinspection PyArgumentList
-        return cls(**dict(zip(cls_fields, cls_values, strict=True)))
+        return cls(**dict(zip(cls.struct_fields, cls_values, strict=True)))
 
     @classmethod
-    def unpack_many(cls, data: bytes) -> list[Self]:
-        length, remainder = divmod(len(data), cls.struct.size)
+    def model_validate_buffer(cls, buffer: bytes | memoryview, offset: int = 0) -> Self:
+        cls_values = cls.struct.unpack_from(buffer, offset)
+        # noinspection PyArgumentList
+        return cls(**dict(zip(cls.struct_fields, cls_values, strict=True)))
+
+    @classmethod
+    def model_validate_stream_many(cls, stream: BytesIO, count: int) -> list[Self]:
+        data = stream.read(cls.struct.size * count)
 
-        if remainder != 0:
+        if len(data) != cls.struct.size * count:
+            raise ValueError(f"Expected {cls.struct.size * count} bytes for {count} items, got {len(data)}")
+
+        return cls.unpack_many(data)
+
+    @classmethod
+    def unpack_many(cls, data: bytes) -> list[Self]:
+        if len(data) % cls.struct.size != 0:
             raise ValueError(f"Data length {len(data)} is not divisible by struct size {cls.struct.size}")
 
-        stream = BytesIO(data)
-        return [cls.model_validate_stream(stream) for _ in range(length)]
+        # noinspection PyArgumentList
+        return [
+            cls(**dict(zip(cls.struct_fields, cls_values, strict=True))) for cls_values in cls.struct.iter_unpack(data)
+        ]
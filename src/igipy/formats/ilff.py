@@ -15,14 +15,14 @@ class ChunkHeader(StructModel):
     alignment: Literal[0, 4, 32] = Field(description="Padding calculation divisor")
     offset: NonNegativeInt = Field(description="Position of next chunk (0 if last)")
 
-    def model_validate_padding(self, stream: BytesIO) -> bytes:
-        padding = (self.alignment - stream.tell() % self.alignment) % self.alignment if self.alignment else 0
-        padding_bytes = stream.read(padding)
+    def model_validate_padding(self, buffer: memoryview, position: int) -> int:
+        padding = (self.alignment - position % self.alignment) % self.alignment if self.alignment else 0
+        padding_bytes = buffer[position : position + padding]
 
-        if padding_bytes not in {b"", b"\x00" * padding}:
-            raise ValueError(f"Unexpected padding bytes: {padding_bytes}")
+        if len(padding_bytes) not in {0, padding} or any(padding_bytes):
+            raise ValueError(f"Unexpected padding bytes: {padding_bytes.tobytes()}")
 
-        return padding_bytes
+        return position + len(padding_bytes)
 
 
 class Chunk(BaseModel):
@@ -31,12 +31,12 @@ class Chunk(BaseModel):
     header: ChunkHeader
 
     @classmethod
-    def model_validate_stream(cls, stream: BytesIO, header: ChunkHeader) -> Self:
+    def model_validate_buffer(cls, buffer: memoryview, position: int, header: ChunkHeader) -> tuple[Self, int]:
         cls.model_validate_header(header)
-        header.model_validate_padding(stream)
-        content = cls.model_validate_content(stream.read(header.length))
-        header.model_validate_padding(stream)
-        return cls(header=header, **content)
+        position = header.model_validate_padding(buffer, position)
+        content = cls.model_validate_content(buffer[position : position + header.length].tobytes())
+        position = header.model_validate_padding(buffer, min(position + header.length, len(buffer)))
+        return cls.model_validate_values(header, content), position
 
     @classmethod
     def model_validate_header(cls, header: ChunkHeader) -> None:
@@ -46,6 +46,10 @@ class Chunk(BaseModel):
     def model_validate_content(cls, content: bytes) -> dict:
         raise NotImplementedError
 
+    @classmethod
+    def model_validate_values(cls, header: ChunkHeader, values: dict) -> Self:
+        return cls(header=header, **values)
+
 
 class RawChunk(Chunk):
     content: bytes
@@ -54,6 +58,11 @@ class RawChunk(Chunk):
     def model_validate_content(cls, content: bytes) -> dict:
         return {"content": content}
 
+    @classmethod
+    def model_validate_values(cls, header: ChunkHeader, values: dict) -> Self:
+        # Raw content has nothing to validate, header was validated already
+        return cls.model_construct(header=header, **values)
+
 
 class ILFFHeader(ChunkHeader):
     fourcc: Literal[b"ILFF"] = Field(description="Chunk signature")
@@ -67,35 +76,39 @@ class ILFF(FileModel):
 
     @classmethod
     def model_validate_chunks(cls, stream: BytesIO) -> tuple[ILFFHeader, bytes, list[Chunk]]:
-        header = ILFFHeader.model_validate_stream(stream)
-        content_type = stream.read(4)
-        content = []
-        header.model_validate_padding(stream)
+        with stream.getbuffer() as buffer:
+            position = stream.tell()
+            header = ILFFHeader.model_validate_buffer(buffer, position)
+            position += ILFFHeader.struct.size
+            content_type = buffer[position : position + 4].tobytes()
+            position = header.model_validate_padding(buffer, position + len(content_type))
+            content = []
+
+            while True:
+                chunk_position_start = position
+                chunk_header = ChunkHeader.model_validate_buffer(buffer, position)
+                chunk, position = cls.model_validate_chunk(buffer, position + ChunkHeader.struct.size, chunk_header)
+                chunk.meta_start = chunk_position_start
+                chunk.meta_end = position
 
-        while True:
-            chunk_position_start = stream.tell()
-            chunk_header = ChunkHeader.model_validate_stream(stream=stream)
-            chunk = cls.model_validate_chunk(stream, chunk_header)
-            chunk_position_end = stream.tell()
-            chunk.meta_start = chunk_position_start
-            chunk.meta_end = chunk_position_end
+                content.append(chunk)
 
-            content.append(chunk)
+                if chunk.header.offset == 0:
+                    break
 
-            if chunk.header.offset == 0:
-                break
+                if position != chunk.meta_start + chunk.header.offset:
+                    raise ValueError(f"Unexpected position: {position} not {chunk.meta_start + chunk.header.offset}")
 
-            if stream.tell() != chunk.meta_start + chunk.header.offset:
-                raise ValueError(f"Unexpected position: {stream.tell()} not {chunk.meta_start + chunk.header.offset}")
+            if position != len(buffer):
+                raise ValueError("Expected end of stream")
 
-        if stream.read(1) != b"":
-            raise ValueError("Expected end of stream")
+        stream.seek(position)
 
         return header, content_type, content
 
     @classmethod
-    def model_validate_chunk(cls, stream: BytesIO, header: ChunkHeader) -> Chunk:
-        return cls.chunk_mapping.get(header.fourcc, Chunk).model_validate_stream(stream, header)
+    def model_validate_chunk(cls, buffer: memoryview, position: int, header: ChunkHeader) -> tuple[Chunk, int]:
+        return cls.chunk_mapping.get(header.fourcc, Chunk).model_validate_buffer(buffer, position, header)
 
 
 def model_validate_header(header: ChunkHeader, fourcc: bytes) -> None:
@@ -1,4 +1,5 @@
 from abc import ABC
+from collections.abc import Generator
 from enum import Enum
 from functools import singledispatchmethod
 from io import BytesIO
@@ -168,9 +169,21 @@ class QSC(FileModel):
 
     def model_dump_stream(self) -> tuple[BytesIO, str]:
         stream = BytesIO()
-        stream_text = self.to_str(self.content, indent=0)
-        stream_text = f"{stream_text.rstrip('\n')}\n"
-        stream.write(stream_text.encode("utf-8"))
+        blank_lines = 0
+
+        for line in self.to_lines(self.content, indent=0):
+            # Blank lines left by empty blocks are kept between statements, but not at the end of the script
+            if not line:
+                blank_lines += 1
+                continue
+
+            stream.write(b"\n" * blank_lines)
+            stream.write(f"{line}\n".encode())
+            blank_lines = 0
+
+        if stream.tell() == 0:
+            stream.write(b"\n")
+
         return stream, ".qsc"
 
     @singledispatchmethod
@@ -242,26 +255,38 @@ class QSC(FileModel):
 
     @to_str.register
     def _(self, node: BlockStatement, indent: int = 0, parent_precedence: int = 0) -> str:  # noqa: ARG002
-        lines = [self.to_str(stmt, indent) for stmt in node.statements]
-        return "\n".join(lines)
+        return "\n".join(self.to_lines(node, indent))
 
     @to_str.register
     def _(self, node: IfStatement, indent: int = 0, parent_precedence: int = 0) -> str:  # noqa: ARG002
-        lines = [
-            f"{self.indent * indent}if({self.to_str(node.condition, indent + 1)})",
-            f"{self.indent * indent}{{",
-            *self.to_str(node.then_block, indent + 1).splitlines(),
-            f"{self.indent * indent}}}",
-        ]
+        return "\n".join(self.to_lines(node, indent))
+
+    @singledispatchmethod
+    def to_lines(self, node: Statement, indent: int = 0) -> Generator[str]:
+        yield self.to_str(node, indent)
+
+    @to_lines.register
+    def _(self, node: BlockStatement, indent: int = 0) -> Generator[str]:
+        if not node.statements:
+            yield ""
+
+        for statement in node.statements:
+            yield from self.to_lines(statement, indent)
+
+    @to_lines.register
+    def _(self, node: IfStatement, indent: int = 0) -> Generator[str]:
+        yield f"{self.indent * indent}if({self.to_str(node.condition, indent + 1)})"
+        yield f"{self.indent * indent}{{"
+        yield from self.to_block_lines(node.then_block, indent + 1)
+        yield f"{self.indent * indent}}}"
 
         if node.else_block:
-            lines.extend(
-                [
-                    f"{self.indent * indent}else",
-                    f"{self.indent * indent}{{",
-                    *self.to_str(node.else_block, indent + 1).splitlines(),
-                    f"{self.indent * indent}}}",
-                ]
-            )
-
-        return "\n".join(lines)
+            yield f"{self.indent * indent}else"
+            yield f"{self.indent * indent}{{"
+            yield from self.to_block_lines(node.else_block, indent + 1)
+            yield f"{self.indent * indent}}}"
+
+    def to_block_lines(self, node: BlockStatement, indent: int = 0) -> list[str]:
+        """Lines of a nested block, without the blank line an empty block leaves at its end"""
+        lines = list(self.to_lines(node, indent))
+        return lines[:-1] if lines and not lines[-1] else lines
@@ -1,8 +1,8 @@
 from abc import ABC
 from functools import singledispatchmethod
 from io import BytesIO
-from struct import Struct, unpack
-from typing import Any, BinaryIO, ClassVar, Literal, Self
+from struct import Struct, unpack_from
+from typing import Any, ClassVar, Literal, Self
 
 from pydantic import BaseModel, NonNegativeInt
 
@@ -14,13 +14,13 @@ class Instruction(BaseModel, ABC):
     next_address: NonNegativeInt
 
     @classmethod
-    def model_validate_stream(cls, stream: BinaryIO, address: NonNegativeInt) -> Self:
-        return cls(address=address, next_address=stream.tell())
+    def model_validate_buffer(cls, buffer: bytes | memoryview, address: NonNegativeInt) -> Self:  # noqa: ARG003
+        return cls.model_construct(address=address, next_address=address + 1)
 
 
 class NotImplementedInstruction(Instruction, ABC):
     @classmethod
-    def model_validate_stream(cls, stream: BinaryIO, address: NonNegativeInt) -> Self:
+    def model_validate_buffer(cls, buffer: bytes | memoryview, address: NonNegativeInt) -> Self:
         raise NotImplementedError(f"{cls.__name__} is not implemented")
 
 
@@ -40,9 +40,9 @@ class StructInstruction(Instruction, ABC):
     value: Any
 
     @classmethod
-    def model_validate_stream(cls, stream: BytesIO, address: NonNegativeInt) -> Self:
-        value = cls.value_struct.unpack(stream.read(cls.value_struct.size))[0]
-        return cls(address=address, next_address=stream.tell(), value=value)
+    def model_validate_buffer(cls, buffer: bytes | memoryview, address: NonNegativeInt) -> Self:
+        value = cls.value_struct.unpack_from(buffer, address + 1)[0]
+        return cls.model_construct(address=address, next_address=address + 1 + cls.value_struct.size, value=value)
 
 
 class LiteralInstruction(Instruction, ABC):
@@ -124,11 +124,10 @@ class CALL(Instruction):
     value: list[int]
 
     @classmethod
-    def model_validate_stream(cls, stream: BinaryIO, address: NonNegativeInt) -> Self:
-        value_count: int = unpack("<I", stream.read(4))[0]
-        value_bytes = stream.read(4 * value_count)
-        value = unpack("<" + "i" * value_count, value_bytes)
-        return cls(address=address, next_address=stream.tell(), value=list(value))
+    def model_validate_buffer(cls, buffer: bytes | memoryview, address: NonNegativeInt) -> Self:
+        value_count: int = unpack_from("<I", buffer, address + 1)[0]
+        value = unpack_from(f"<{value_count}i", buffer, address + 5)
+        return cls.model_construct(address=address, next_address=address + 5 + 4 * value_count, value=list(value))
 
 
 POP = type("POP", (Instruction,), {})
@@ -143,112 +142,119 @@ QVM_VERSION_5 = 5
 
 QVM_VERSION_7 = 7
 
+QVM_STRING_ESCAPES = str.maketrans({"\n": "\\n", '"': '\\"'})
+
 # noinspection DuplicatedCode
-QVM_INSTRUCTION: dict[int, dict[bytes, type[Instruction]]] = {
+QVM_INSTRUCTION: dict[int, dict[int, type[Instruction]]] = {
     QVM_VERSION_5: {
-        b"\x00": BRK,
-        b"\x01": NOP,
-        b"\x02": PUSH,
-        b"\x03": PUSHB,
-        b"\x04": PUSHW,
-        b"\x05": PUSHF,
-        b"\x06": PUSHA,
-        b"\x07": PUSHS,
-        b"\x08": PUSHSI,
-        b"\x09": PUSHSIB,
-        b"\x0a": PUSHSIW,
-        b"\x0b": PUSHI,
-        b"\x0c": PUSHII,
-        b"\x0d": PUSHIIB,
-        b"\x0e": PUSHIIW,
-        b"\x0f": PUSH0,
-        b"\x10": PUSH1,
-        b"\x11": PUSHM,
-        b"\x12": POP,
-        b"\x13": RET,
-        b"\x14": BRA,
-        b"\x15": BF,
-        b"\x16": BT,
-        b"\x17": JSR,
-        b"\x18": CALL,
-        b"\x19": ADD,
-        b"\x1a": SUB,
-        b"\x1b": MUL,
-        b"\x1c": DIV,
-        b"\x1d": SHL,
-        b"\x1e": SHR,
-        b"\x1f": AND,
-        b"\x20": OR,
-        b"\x21": XOR,
-        b"\x22": LAND,
-        b"\x23": LOR,
-        b"\x24": EQ,
-        b"\x25": NE,
-        b"\x26": LT,
-        b"\x27": LE,
-        b"\x28": GT,
-        b"\x29": GE,
-        b"\x2a": ASSIGN,
-        b"\x2b": PLUS,
-        b"\x2c": MINUS,
-        b"\x2d": INV,
-        b"\x2e": NOT,
-        b"\x2f": BLK,
-        b"\x30": ILLEGAL,
+        0x00: BRK,
+        0x01: NOP,
+        0x02: PUSH,
+        0x03: PUSHB,
+        0x04: PUSHW,
+        0x05: PUSHF,
+        0x06: PUSHA,
+        0x07: PUSHS,
+        0x08: PUSHSI,
+        0x09: PUSHSIB,
+        0x0A: PUSHSIW,
+        0x0B: PUSHI,
+        0x0C: PUSHII,
+        0x0D: PUSHIIB,
+        0x0E: PUSHIIW,
+        0x0F: PUSH0,
+        0x10: PUSH1,
+        0x11: PUSHM,
+        0x12: POP,
+        0x13: RET,
+        0x14: BRA,
+        0x15: BF,
+        0x16: BT,
+        0x17: JSR,
+        0x18: CALL,
+        0x19: ADD,
+        0x1A: SUB,
+        0x1B: MUL,
+        0x1C: DIV,
+        0x1D: SHL,
+        0x1E: SHR,
+        0x1F: AND,
+        0x20: OR,
+        0x21: XOR,
+        0x22: LAND,
+        0x23: LOR,
+        0x24: EQ,
+        0x25: NE,
+        0x26: LT,
+        0x27: LE,
+        0x28: GT,
+        0x29: GE,
+        0x2A: ASSIGN,
+        0x2B: PLUS,
+        0x2C: MINUS,
+        0x2D: INV,
+        0x2E: NOT,
+        0x2F: BLK,
+        0x30: ILLEGAL,
     },
     QVM_VERSION_7: {
-        b"\x00": BRK,
-        b"\x01": NOP,
-        b"\x02": RET,
-        b"\x03": BRA,
-        b"\x04": BF,
-        b"\x05": BT,
-        b"\x06": JSR,
-        b"\x07": CALL,
-        b"\x08": PUSH,
-        b"\x09": PUSHB,
-        b"\x0a": PUSHW,
-        b"\x0b": PUSHF,
-        b"\x0c": PUSHA,
-        b"\x0d": PUSHS,
-        b"\x0e": PUSHSI,
-        b"\x0f": PUSHSIB,
-        b"\x10": PUSHSIW,
-        b"\x11": PUSHI,
-        b"\x12": PUSHII,
-        b"\x13": PUSHIIB,
-        b"\x14": PUSHIIW,
-        b"\x15": PUSH0,
-        b"\x16": PUSH1,
-        b"\x17": PUSHM,
-        b"\x18": POP,
-        b"\x19": ADD,
-        b"\x1a": SUB,
-        b"\x1b": MUL,
-        b"\x1c": DIV,
-        b"\x1d": SHL,
-        b"\x1e": SHR,
-        b"\x1f": AND,
-        b"\x20": OR,
-        b"\x21": XOR,
-        b"\x22": LAND,
-        b"\x23": LOR,
-        b"\x24": EQ,
-        b"\x25": NE,
-        b"\x26": LT,
-        b"\x27": LE,
-        b"\x28": GT,
-        b"\x29": GE,
-        b"\x2a": ASSIGN,
-        b"\x2b": PLUS,
-        b"\x2c": MINUS,
-        b"\x2d": INV,
-        b"\x2e": NOT,
-        b"\x2f": BLK,
-        b"\x30": ILLEGAL,
+        0x00: BRK,
+        0x01: NOP,
+        0x02: RET,
+        0x03: BRA,
+        0x04: BF,
+        0x05: BT,
+        0x06: JSR,
+        0x07: CALL,
+        0x08: PUSH,
+        0x09: PUSHB,
+        0x0A: PUSHW,
+        0x0B: PUSHF,
+        0x0C: PUSHA,
+        0x0D: PUSHS,
+        0x0E: PUSHSI,
+        0x0F: PUSHSIB,
+        0x10: PUSHSIW,
+        0x11: PUSHI,
+        0x12: PUSHII,
+        0x13: PUSHIIB,
+        0x14: PUSHIIW,
+        0x15: PUSH0,
+        0x16: PUSH1,
+        0x17: PUSHM,
+        0x18: POP,
+        0x19: ADD,
+        0x1A: SUB,
+        0x1B: MUL,
+        0x1C: DIV,
+        0x1D: SHL,
+        0x1E: SHR,
+        0x1F: AND,
+        0x20: OR,
+        0x21: XOR,
+        0x22: LAND,
+        0x23: LOR,
+        0x24: EQ,
+        0x25: NE,
+        0x26: LT,
+        0x27: LE,
+        0x28: GT,
+        0x29: GE,
+        0x2A: ASSIGN,
+        0x2B: PLUS,
+        0x2C: MINUS,
+        0x2D: INV,
+        0x2E: NOT,
+        0x2F: BLK,
+        0x30: ILLEGAL,
     },
 }
 
+QVM_INSTRUCTION_TABLE: dict[int, list[type[Instruction]]] = {
+    version: [instructions.get(bytecode, NotImplementedInstruction) for bytecode in range(256)]
+    for version, instructions in QVM_INSTRUCTION.items()
+}
+
 
 class QVMHeader(BaseModel):
     signature: Literal[b"LOOP"]
@@ -268,15 +274,17 @@ class QVMHeader(BaseModel):
     unknown_2: Literal[0]
     footer_data_offset: NonNegativeInt | None = None
 
+    struct: ClassVar[Struct] = Struct("<4s14I")
+    footer_struct: ClassVar[Struct] = Struct("<I")
+
     @classmethod
     def model_validate_bytes(cls, data: bytes) -> "QVMHeader":
-        obj_values = unpack("4s14I", data[:60])
+        obj_values = cls.struct.unpack_from(data)
         obj_mapping = dict(zip(cls.__pydantic_fields__.keys(), obj_values, strict=False))
         obj = cls(**obj_mapping)
 
-        if obj.minor_version == 5 and len(data[60:]) > 4:  # noqa: PLR2004
-            footer_offset = unpack("I", data[60:64])[0]
-            obj.footer_data_offset = footer_offset
+        if obj.minor_version == 5 and len(data) > cls.struct.size + cls.footer_struct.size:  # noqa: PLR2004
+            obj.footer_data_offset = cls.footer_struct.unpack_from(data, cls.struct.size)[0]
 
         return obj
 
@@ -311,7 +319,7 @@ class QVM(FileModel):
         strings = cls.bytes_to_list_of_strings(data=data[header.strings_slice])
 
         instructions = cls.bytes_to_dict_of_instructions(
-            data=data[header.instructions_slice],
+            data=memoryview(data)[header.instructions_slice],
             version=header.minor_version,
         )
 
@@ -319,22 +327,19 @@ class QVM(FileModel):
 
     @classmethod
     def bytes_to_list_of_strings(cls, data: bytes) -> list[str]:
-        value_bytes = data.split(b"\x00")[:-1]
-        value_strings = [value.decode("utf-8") for value in value_bytes]
-        value = [value.replace("\n", "\\n").replace('"', '\\"') for value in value_strings]
-        return value  # noqa: RET504
+        return [value.decode("utf-8").translate(QVM_STRING_ESCAPES) for value in data.split(b"\x00")[:-1]]
 
     @classmethod
-    def bytes_to_dict_of_instructions(cls, data: bytes, version: Literal[5, 7]) -> dict[int, Instruction]:
-        stream = BytesIO(data)
+    def bytes_to_dict_of_instructions(cls, data: bytes | memoryview, version: Literal[5, 7]) -> dict[int, Instruction]:
         result = {}
-        bytecode_to_instruction = QVM_INSTRUCTION[version]
+        bytecode_to_instruction = QVM_INSTRUCTION_TABLE[version]
+        address = 0
 
-        while stream.tell() < len(data):
-            address = stream.tell()
-            instruction_class = bytecode_to_instruction.get(stream.read(1), NotImplementedInstruction)
-            instruction = instruction_class.model_validate_stream(stream, address)
+        while address < len(data):
+            instruction_class = bytecode_to_instruction[data[address]]
+            instruction = instruction_class.model_validate_buffer(data, address)
             result[instruction.address] = instruction
+            address = instruction.next_address
 
         return result
 
@@ -343,11 +348,12 @@ class QVM(FileModel):
 
     def rebuild_stack(self, next_address: int = 0, stop_address: int | None = None) -> qsc.Stack:
         stack = qsc.Stack()
+        to_ast = self.to_ast
 
         while next_address != stop_address:
             try:
                 instruction = self.instructions[next_address]
-                next_address = self.to_ast(instruction, stack=stack)
+                next_address = to_ast(instruction, stack=stack)
             except StopIteration:
                 break
 
@@ -359,7 +365,7 @@ class QVM(FileModel):
 
         for node in stack.root:
             if isinstance(node, qsc.Expression):
-                statement_node = qsc.ExprStatement(expression=node)
+                statement_node = qsc.ExprStatement.model_construct(expression=node)
             elif isinstance(node, qsc.Statement):
                 statement_node = node
             else:
@@ -367,7 +373,7 @@ class QVM(FileModel):
 
             statements.append(statement_node)
 
-        return qsc.BlockStatement(statements=statements)
+        return qsc.BlockStatement.model_construct(statements=statements)
 
     @singledispatchmethod
     def to_ast(self, instruction: Instruction, stack: qsc.Stack) -> int:
@@ -375,28 +381,28 @@ class QVM(FileModel):
 
     @to_ast.register
     def _(self, instruction: LiteralInstruction, stack: qsc.Stack) -> int:
-        stack.push(qsc.Literal(value=instruction.value))
+        stack.push(qsc.Literal.model_construct(value=instruction.value))
         return instruction.next_address
 
     @to_ast.register
     def _(self, instruction: ConstantInstruction, stack: qsc.Stack) -> int:
-        stack.push(qsc.Literal(value=instruction.value))
+        stack.push(qsc.Literal.model_construct(value=instruction.value))
         return instruction.next_address
 
     @to_ast.register
     def _(self, instruction: StringInstruction, stack: qsc.Stack) -> int:
-        stack.push(qsc.Literal(value=self.strings[instruction.value]))
+        stack.push(qsc.Literal.model_construct(value=self.strings[instruction.value]))
         return instruction.next_address
 
     @to_ast.register
     def _(self, instruction: VariableInstruction, stack: qsc.Stack) -> int:
-        stack.push(qsc.Variable(name=self.variables[instruction.value]))
+        stack.push(qsc.Variable.model_construct(name=self.variables[instruction.value]))
         return instruction.next_address
 
     @to_ast.register
     def _(self, instruction: UnaryOpInstruction, stack: qsc.Stack) -> int:
         operand = stack.pop_expression()
-        node = qsc.UnaryOp(operator=qsc.UnaryOp.Operator(instruction.operator), operand=operand)
+        node = qsc.UnaryOp.model_construct(operator=qsc.UnaryOp.Operator(instruction.operator), operand=operand)
         stack.push(node)
         return instruction.next_address
 
@@ -404,7 +410,9 @@ class QVM(FileModel):
     def _(self, instruction: BinaryOpInstruction, stack: qsc.Stack) -> int:
         right = stack.pop_expression()
         left = stack.pop_expression()
-        node = qsc.BinaryOp(operator=qsc.BinaryOp.Operator(instruction.operator), left=left, right=right)
+        node = qsc.BinaryOp.model_construct(
+            operator=qsc.BinaryOp.Operator(instruction.operator), left=left, right=right
+        )
         stack.push(node)
         return instruction.next_address
 
@@ -432,7 +440,7 @@ class QVM(FileModel):
             argument_stack.empty()
             arguments.append(argument)
 
-        stack.push(qsc.Call(function=function.name, arguments=arguments))
+        stack.push(qsc.Call.model_construct(function=function.name, arguments=arguments))
 
         next_instruction = self.instructions[instruction.next_address]
         next_address = next_instruction.next_address + next_instruction.value
@@ -453,15 +461,15 @@ class QVM(FileModel):
                 stop_address=next_instruction.next_address + next_instruction.value,
             )
 
-            node = qsc.IfStatement(condition=condition, then_block=then_block, else_block=else_block)
+            node = qsc.IfStatement.model_construct(condition=condition, then_block=then_block, else_block=else_block)
             next_address = next_instruction.next_address + next_instruction.value
 
         elif next_instruction.value == 0:
-            node = qsc.IfStatement(condition=condition, then_block=then_block)
+            node = qsc.IfStatement.model_construct(condition=condition, then_block=then_block)
             next_address = instruction.next_address + instruction.value
 
         else:
-            node = qsc.WhileStatement(condition=condition, loop_block=then_block)
+            node = qsc.WhileStatement.model_construct(condition=condition, loop_block=then_block)
             next_address = instruction.next_address + instruction.value
 
         stack.push(node)
@@ -1,5 +1,6 @@
 import json
 from io import BytesIO
+from itertools import batched
 from typing import ClassVar, Literal, Self
 from zipfile import ZipFile
 
@@ -60,7 +61,7 @@ class RES(ilff.ILFF):
         if content_type != b"IRES":
             raise ValueError(f"Unknown content type: {content_type}")
 
-        content_pairs = list(zip(chunks[::2], chunks[1::2], strict=True))
+        content_pairs = list(batched(chunks, 2, strict=True))
         content_paths = content_pairs.pop(-1) if content_pairs[-1][1].header.fourcc == b"PATH" else None
 
         # noinspection PyTypeChecker
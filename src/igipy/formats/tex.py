@@ -1,5 +1,5 @@
 from io import BytesIO
-from struct import Struct, unpack
+from struct import Struct
 from typing import ClassVar, Literal, Self, Union
 
 import numpy as np
@@ -13,50 +13,34 @@ TEX_VERSION_07 = 7
 TEX_VERSION_09 = 9
 TEX_VERSION_11 = 11
 
+TEX_MODE_DEPTH = {2: 2, 3: 4, 67: 4}
+
 
 class TEX(base.FileModel):
+    header_struct: ClassVar[Struct] = Struct("4sI")
+
     variant: Union["TEX02", "TEX07", "TEX09", "TEX11"]
 
     @classmethod
     def model_validate_stream(cls, stream: BytesIO) -> Self:
-        signature, version = unpack("4sI", stream.read(8))
+        with stream.getbuffer() as buffer:
+            signature, version = cls.header_struct.unpack_from(buffer)
 
-        stream.seek(0)
+        variant_class = TEX_VARIANTS.get(version)
 
-        if version == TEX_VERSION_02:
-            variant = TEX02.model_validate_stream(stream)
-        elif version == TEX_VERSION_07:
-            variant = TEX07.model_validate_stream(stream)
-        elif version == TEX_VERSION_09:
-            variant = TEX09.model_validate_stream(stream)
-        elif version == TEX_VERSION_11:
-            variant = TEX11.model_validate_stream(stream)
-        else:
+        if variant_class is None:
             raise ValueError(f"Unsupported version: {version}")
 
-        return cls(variant=variant)
-
-    def model_dump_stream(self) -> tuple[BytesIO, str]:
-        if isinstance(self.variant, TEX02):
-            return self.variant.model_dump_stream()
-
-        if isinstance(self.variant, (TEX07, TEX09)):
-            return self.variant.model_dump_stream()
+        stream.seek(0)
 
-        if isinstance(self.variant, TEX11):
-            return self.variant.model_dump_stream()
+        return cls(variant=variant_class.model_validate_stream(stream))
 
-        raise ValueError(f"Unsupported variant: {self.variant}")
+    def model_dump_stream(self) -> tuple[BytesIO, str]:
+        return self.variant.model_dump_stream()
 
     @property
     def mipmaps(self) -> list["Mipmap"]:
-        if isinstance(self.variant, TEX02):
-            return [self.variant.content]
-        if isinstance(self.variant, (TEX07, TEX09)):
-            return self.variant.item_contents
-        if isinstance(self.variant, TEX11):
-            return self.variant.content
-        raise ValueError(f"Unsupported variant: {self.variant}")
+        return self.variant.mipmaps
 
 
 class TEX02(BaseModel):
@@ -73,6 +57,10 @@ class TEX02(BaseModel):
 
         return cls(header=header, content=content)
 
+    @property
+    def mipmaps(self) -> list["Mipmap"]:
+        return [self.content]
+
     def model_dump_stream(self) -> tuple[BytesIO, str]:
         return TGA.from_raw_bytes(
             width=self.header.width,
@@ -92,16 +80,14 @@ class TEX07(BaseModel):
     @classmethod
     def model_validate_stream(cls, stream: BytesIO) -> Self:
         header = TEX07Header.model_validate_stream(stream)
-        item_headers = [TEX07ItemHeader.model_validate_stream(stream) for _ in range(header.count)]
-        item_contents = [
-            Mipmap.model_validate_stream(
-                stream,
-                width=header.width,
-                height=header.height,
-                mode=header.mode,
-            )
-            for _ in range(header.count)
-        ]
+        item_headers = TEX07ItemHeader.model_validate_stream_many(stream, header.count)
+        item_contents = Mipmap.model_validate_stream_many(
+            stream,
+            count=header.count,
+            width=header.width,
+            height=header.height,
+            mode=header.mode,
+        )
         footer = TEX06.model_validate_stream(stream)
 
         if stream.read(1) != b"":
@@ -109,6 +95,10 @@ class TEX07(BaseModel):
 
         return cls(header=header, item_headers=item_headers, item_contents=item_contents, footer=footer)
 
+    @property
+    def mipmaps(self) -> list["Mipmap"]:
+        return self.item_contents
+
     def model_dump_stream(self) -> tuple[BytesIO, str]:
         bitmap = self.bitmap
 
@@ -127,13 +117,10 @@ class TEX07(BaseModel):
         tiles_rows: int = self.footer.header.count_y
 
         tile_height, tile_width = tiles[0].shape
-        full_image = np.zeros((tiles_rows * tile_height, tiles_cols * tile_width), dtype=tiles[0].dtype)
+        grid = np.zeros((tiles_rows, tiles_cols, tile_height, tile_width), dtype=tiles[0].dtype)
+        grid.reshape(-1, tile_height, tile_width)[: len(tiles)] = tiles
 
-        for index, tile in enumerate(tiles):
-            row, col = divmod(index, tiles_cols)
-            full_image[row * tile_height : (row + 1) * tile_height, col * tile_width : (col + 1) * tile_width] = tile
-
-        return full_image
+        return grid.swapaxes(1, 2).reshape(tiles_rows * tile_height, tiles_cols * tile_width)
 
 
 class TEX09(TEX07):
@@ -145,16 +132,14 @@ class TEX09(TEX07):
     @classmethod
     def model_validate_stream(cls, stream: BytesIO) -> Self:
         header = TEX09Header.model_validate_stream(stream)
-        item_headers = [TEX09ItemHeader.model_validate_stream(stream) for _ in range(header.count)]
-        item_contents = [
-            Mipmap.model_validate_stream(
-                stream,
-                width=header.width,
-                height=header.height,
-                mode=header.mode,
-            )
-            for _ in range(header.count)
-        ]
+        item_headers = TEX09ItemHeader.model_validate_stream_many(stream, header.count)
+        item_contents = Mipmap.model_validate_stream_many(
+            stream,
+            count=header.count,
+            width=header.width,
+            height=header.height,
+            mode=header.mode,
+        )
         footer = TEX06.model_validate_stream(stream)
 
         if stream.read(1) != b"":
@@ -172,14 +157,13 @@ class TEX11(BaseModel):
         header = TEX11Header.model_validate_stream(stream)
         content = []
 
-        for level in range(10):
-            position = stream.tell()
+        with stream.getbuffer() as buffer:
+            stream_size = buffer.nbytes
 
-            if stream.read(1) == b"":
+        for level in range(10):
+            if stream.tell() >= stream_size:
                 break
 
-            stream.seek(position)
-
             content.append(
                 Mipmap.model_validate_stream(
                     stream,
@@ -190,11 +174,15 @@ class TEX11(BaseModel):
                 )
             )
 
-        if stream.read(1) != b"":
+        if stream.tell() < stream_size:
             raise ValueError("Parsing incomplete. Expected to reach EOF.")
 
         return cls(header=header, content=content)
 
+    @property
+    def mipmaps(self) -> list["Mipmap"]:
+        return self.content
+
     def model_dump_stream(self) -> tuple[BytesIO, str]:
         return TGA.from_raw_bytes(
             width=self.header.width,
@@ -212,7 +200,7 @@ class TEX06(BaseModel):
     @classmethod
     def model_validate_stream(cls, stream: BytesIO) -> Self:
         header = TEX06Header.model_validate_stream(stream)
-        content = [TEX06Content.model_validate_stream(stream) for _ in range(header.count_x * header.count_y)]
+        content = TEX06Content.model_validate_stream_many(stream, header.count_x * header.count_y)
         return cls(header=header, content=content)
 
 
@@ -291,16 +279,26 @@ class Mipmap(BaseModel):
 
         @property
         def bitmap_depth(self) -> int:
-            return {2: 2, 3: 4, 67: 4}[self.mode]
+            return TEX_MODE_DEPTH[self.mode]
 
     header: Header
     bitmap: bytes
 
     @classmethod
     def model_validate_stream(cls, stream: BytesIO, width: int, height: int, mode: int, level: int = 0) -> Self:
-        header = cls.Header(level=level, mode=mode, width=width, height=height)
+        header = cls.Header.model_construct(level=level, mode=mode, width=width, height=height)
         bitmap = stream.read(header.bitmap_width * header.bitmap_height * header.bitmap_depth)
-        return cls(header=header, bitmap=bitmap)
+        return cls.model_construct(header=header, bitmap=bitmap)
+
+    @classmethod
+    def model_validate_stream_many(cls, stream: BytesIO, count: int, width: int, height: int, mode: int) -> list[Self]:
+        header = cls.Header.model_construct(level=0, mode=mode, width=width, height=height)
+        size = header.bitmap_width * header.bitmap_height * header.bitmap_depth
+        bitmaps = stream.read(size * count)
+        return [
+            cls.model_construct(header=header, bitmap=bitmaps[index * size : (index + 1) * size])
+            for index in range(count)
+        ]
 
     @property
     def bitmap_np(self) -> np.ndarray:
@@ -366,3 +364,11 @@ class TEX09ItemHeader(base.StructModel):
     unknown_04: NonNegativeInt
     unknown_05: NonNegativeInt
     unknown_06: NonNegativeInt
+
+
+TEX_VARIANTS: dict[int, type[TEX02 | TEX07 | TEX09 | TEX11]] = {
+    TEX_VERSION_02: TEX02,
+    TEX_VERSION_07: TEX07,
+    TEX_VERSION_09: TEX09,
+    TEX_VERSION_11: TEX11,
+}
@@ -1,5 +1,7 @@
 import struct
 
+import numpy as np
+
 # Standard IMA ADPCM step-size table (89 entries)
 step_size_table = [
     *[7, 8, 9, 10, 11, 12, 13, 14, 16, 17],
@@ -126,7 +128,37 @@ def encode(data: bytes, channels: int = 1) -> bytes:  # noqa: PLR0915, PLR0912,
     return bytes(output_bytes)
 
 
-def decode(data: bytes, channels: int = 1) -> bytes:  # noqa: PLR0912, C901
+def build_decode_tables() -> tuple[list[int], list[int]]:
+    """
+    Precomputes the decoder state transitions for every (step index, code) pair.
+
+    Both tables are indexed by ``step_index * 16 + code``. The first one holds the signed
+    difference to add to the predictor, the second one holds the next step index, already
+    multiplied by 16 so it can be used directly as the base of the next lookup.
+    """
+    delta_table = []
+    next_table = []
+
+    for step_index, step in enumerate(step_size_table):
+        for code in range(16):
+            reconstructed_diff = step >> 3
+            if code & 1:
+                reconstructed_diff += step >> 2
+            if code & 2:
+                reconstructed_diff += step >> 1
+            if code & 4:
+                reconstructed_diff += step
+
+            delta_table.append(-reconstructed_diff if code & 8 else reconstructed_diff)
+            next_table.append(min(max(step_index + index_table[code & 7], 0), 88) * 16)
+
+    return delta_table, next_table
+
+
+decode_delta_table, decode_next_table = build_decode_tables()
+
+
+def decode(data: bytes, channels: int = 1) -> bytes:
     """
     Decodes data from a custom 4-bit ADPCM format back into raw 16-bit PCM audio,
     with support for multiple interleaved channels.
@@ -135,50 +167,31 @@ def decode(data: bytes, channels: int = 1) -> bytes:  # noqa: PLR0912, C901
     :param channels: The number of audio channels (e.g., 1 for mono, 2 for stereo).
     :return: A byte string of raw, interleaved 16-bit PCM samples.
     """
-    # These tables must be identical to the ones used in the encoder.
-
     if not data or channels < 1:
         return b""
 
     # The terminator/padding logic is based on the total number of samples (nibbles),
     # so it works independently of the channel count.
     has_terminator = len(data) > 0 and data[-1] == 0xAB  # noqa: PLR2004
-    data_to_decode = data[:-1] if has_terminator else data
-
-    # --- Multi-channel state initialization ---
-    states = [{"predictor": 0, "step_index": 0} for _ in range(channels)]
+    data_to_decode = np.frombuffer(data, dtype=np.uint8, count=len(data) - 1 if has_terminator else -1)
 
-    decoded_samples = []
-    nibble_index = 0
+    # Unpack bytes into nibbles, high nibble first
+    codes = np.empty(data_to_decode.size * 2, dtype=np.uint8)
+    codes[0::2] = data_to_decode >> 4
+    codes[1::2] = data_to_decode & 0x0F
 
-    # Unpack bytes into nibbles and decode each one
-    for byte in data_to_decode:
-        nibbles = [(byte >> 4) & 0x0F, byte & 0x0F]
-        for code in nibbles:
-            # Determine which channel this nibble belongs to
-            channel_idx = nibble_index % channels
+    decoded_samples = np.empty(codes.size, dtype="<i2")
 
-            # Get the current state for this channel
-            state = states[channel_idx]
-            predictor = state["predictor"]
-            step_index = state["step_index"]
+    # Nibbles are interleaved by channel and every channel keeps its own state,
+    # so each channel is decoded independently with table lookups only.
+    for channel_idx in range(channels):
+        predictor = 0
+        state = 0
+        channel_samples = []
 
-            step = step_size_table[step_index]
-
-            # Reconstruct the difference from the 4-bit code
-            reconstructed_diff = step >> 3
-            if code & 1:
-                reconstructed_diff += step >> 2
-            if code & 2:
-                reconstructed_diff += step >> 1
-            if code & 4:
-                reconstructed_diff += step
-
-            # Update the predictor to get the decoded sample
-            if code & 8:  # Sign bit
-                predictor -= reconstructed_diff
-            else:
-                predictor += reconstructed_diff
+        for code in codes[channel_idx::channels].tolist():
+            key = state + code
+            predictor += decode_delta_table[key]
 
             # Clamp predictor to 16-bit range
             if predictor > 32767:  # noqa: PLR2004
@@ -186,26 +199,13 @@ def decode(data: bytes, channels: int = 1) -> bytes:  # noqa: PLR0912, C901
             elif predictor < -32768:  # noqa: PLR2004
                 predictor = -32768
 
-            decoded_samples.append(predictor)
-
-            # Update the step index, mirroring the encoder
-            step_index += index_table[code & 7]
-            if step_index < 0:
-                step_index = 0
-            elif step_index > 88:  # noqa: PLR2004
-                step_index = 88
+            channel_samples.append(predictor)
+            state = decode_next_table[key]
 
-            # --- Store the updated state for the current channel ---
-            state["predictor"] = predictor
-            state["step_index"] = step_index
-
-            nibble_index += 1
+        decoded_samples[channel_idx::channels] = channel_samples
 
     # If the original total sample count was odd, the last nibble was padding. Discard it.
-    if not has_terminator and len(decoded_samples) > 0:
-        decoded_samples.pop()
+    if not has_terminator:
+        decoded_samples = decoded_samples[:-1]
 
-    # Pack the list of interleaved signed shorts into the final PCM byte string
-    if not decoded_samples:
-        return b""
-    return struct.pack(f"<{len(decoded_samples)}h", *decoded_samples)
+    return decoded_samples.tobytes()
@@ -1,4 +1,3 @@
-import wave
 from io import BytesIO
 from struct import Struct
 from typing import ClassVar, Literal, Self
@@ -10,6 +9,8 @@ from .utils import adpcm
 
 
 class WAV(base.FileModel):
+    riff_struct: ClassVar[Struct] = Struct("<4sI4s4sIHHIIHH4sI")
+
     header: "WAVHeader"
     content: bytes
 
@@ -31,12 +32,26 @@ class WAV(base.FileModel):
     def model_dump_stream(self) -> tuple[BytesIO, str]:
         stream = BytesIO()
         samples = self.samples
+        block_align = self.header.channels * (self.header.sample_width // 8)
 
-        with wave.open(stream, "w") as wave_stream:
-            wave_stream.setnchannels(self.header.channels)
-            wave_stream.setsampwidth(self.header.sample_width // 8)
-            wave_stream.setframerate(self.header.framerate)
-            wave_stream.writeframesraw(samples)
+        stream.write(
+            self.riff_struct.pack(
+                b"RIFF",
+                36 + len(samples),
+                b"WAVE",
+                b"fmt ",
+                16,
+                1,  # WAVE_FORMAT_PCM
+                self.header.channels,
+                self.header.framerate,
+                self.header.framerate * block_align,
+                block_align,
+                self.header.sample_width,
+                b"data",
+                len(samples),
+            )
+        )
+        stream.write(samples)
 
         return stream, ".wav"
 
@@ -1,3 +1,5 @@
+import os
+import stat
 import zipfile
 from collections.abc import Generator
 from io import BytesIO
@@ -6,6 +8,8 @@ from typing import Annotated
 
 from pydantic import BaseModel, PlainSerializer, field_validator
 
+from igipy import utils
+
 PosixPath = Annotated[Path, PlainSerializer(lambda value: value.as_posix(), return_type=str, when_used="json")]
 
 
@@ -34,28 +38,46 @@ class IGI1Manager(BaseManager):
     @field_validator("unpack_dir", "target_dir", mode="after")
     @classmethod
     def is_work_dir(cls, value: Path) -> Path:
-        if not value.exists():
+        try:
+            is_dir = stat.S_ISDIR(value.stat().st_mode)
+        except FileNotFoundError:
             value.mkdir(parents=True)
+            is_dir = True
 
-        if not value.is_dir():
+        if not is_dir:
             raise ValueError(f"{value.as_posix()} is not a directory")
 
         return value
 
     def read_from_source(self, patterns: list[str]) -> Generator[tuple[BytesIO, Path, None]]:
-        for src_path in self.source_dir.glob("**/*"):
-            if src_path.is_file(follow_symlinks=False) and any(src_path.match(pattern) for pattern in patterns):
+        name_regex = utils.compile_name_patterns(patterns)
+
+        for path in utils.iter_files(self.source_dir):
+            if not name_regex.match(os.path.normcase(os.path.basename(path))):  # noqa: PTH119
+                continue
+
+            src_path = Path(path)
+
+            if any(src_path.match(pattern) for pattern in patterns):
                 yield BytesIO(src_path.read_bytes()), src_path.relative_to(self.source_dir), None
 
     def read_from_unpack(self, patterns: list[str]) -> Generator[tuple[BytesIO, Path, Path]]:
-        for zip_path in self.unpack_dir.glob("**/*.zip"):
+        name_regex = utils.compile_name_patterns(patterns)
+
+        for path in utils.iter_files(self.unpack_dir, suffix=".zip"):
+            zip_path = Path(path)
+            zip_relative_path = zip_path.relative_to(self.unpack_dir)
+
             with zipfile.ZipFile(zip_path, "r") as zip_file:
                 for file_info in zip_file.infolist():
+                    if not name_regex.match(os.path.normcase(file_info.filename.rsplit("/", 1)[-1])):
+                        continue
+
                     src_path = Path(file_info.filename)
 
                     if any(src_path.match(pattern) for pattern in patterns):
                         src_stream = BytesIO(zip_file.read(file_info))
-                        yield src_stream, src_path, zip_path.relative_to(self.unpack_dir)
+                        yield src_stream, src_path, zip_relative_path
 
     def read_all_res(self) -> Generator[tuple[BytesIO, Path, Path | None]]:
         yield from self.read_from_source(patterns=["**/*.res"])
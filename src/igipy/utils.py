@@ -1,33 +1,167 @@
-from collections.abc import Generator
+import fnmatch
+import functools
+import os
+import queue
+import re
+import threading
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
 import typer
 
-from igipy import formats
+from igipy.formats.base import FileIgnored, FileModel
+
+
+def iter_files(root: Path, suffix: str | None = None) -> Generator[str]:
+    """Walk root recursively using os.scandir and yield paths of regular files"""
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and (suffix is None or entry.name.endswith(suffix)):
+                    yield entry.path
+
+
+def compile_name_patterns(patterns: list[str]) -> re.Pattern:
+    """Compile the last part of each glob pattern into one regex matching normcased file names"""
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern.rsplit("/", 1)[-1])) for pattern in patterns))
+
+
+DEFAULT_WORKERS = min(32, os.cpu_count() or 1)
+
+
+def prefetch[T](iterable: Iterable[T], size: int = 2) -> Generator[T]:
+    """Consume iterable in a background thread, keeping up to size items read ahead"""
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    done = object()
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                items.put((item, None))
+
+                if stop.is_set():
+                    return
+        except Exception as e:  # noqa: BLE001
+            items.put((done, e))
+        else:
+            items.put((done, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = items.get()
+
+            if error is not None:
+                raise error
+
+            if item is done:
+                return
+
+            yield item
+    finally:
+        stop.set()
+
+        while not items.empty():
+            items.get_nowait()
+
+        # The drained queue has room for the one put the producer may still make before it sees stop
+        thread.join()
+
+
+@functools.cache
+def make_dirs(path: Path) -> None:
+    """Create directory with parents, at most once per process in a convert_many run"""
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def convert(  # noqa: PLR0913
+    src_stream: BytesIO,
+    src_path: Path,
+    zip_path: Path | None,
+    *,
+    parser: type[FileModel],
+    router: dict[str, Path],
+    dry: bool = True,
+) -> Path | None:
+    """Convert one file and write the result, returning destination path or None if the file is ignored"""
+    instance = parser.model_validate_stream(src_stream)
+
+    try:
+        dst_stream, dst_suffix = instance.model_dump_stream()
+    except FileIgnored:
+        return None
+
+    dst_path = zip_path.joinpath(src_path).with_suffix(dst_suffix) if zip_path else src_path.with_suffix(dst_suffix)
+
+    for pattern, target_dir in router.items():
+        if dst_path.match(pattern):
+            dst_path = target_dir.joinpath(dst_path)
+            break
+
+    if not dry:
+        make_dirs(dst_path.parent)
+        dst_path.write_bytes(dst_stream.getbuffer())
+
+    return dst_path
+
+
+def convert_many(
+    reader: Iterable[tuple[BytesIO, Path, Path | None]],
+    parser: type[FileModel],
+    router: dict[str, Path],
+    dry: bool = True,
+    workers: int = 1,
+) -> Generator[tuple[Path | None, Path, Path | None]]:
+    """Convert files from reader in a process pool, yielding destination paths in reader order"""
+    # Directories may have been removed since the previous run, and pool workers fork with this cleared cache
+    make_dirs.cache_clear()
+
+    task = functools.partial(convert, parser=parser, router=router, dry=dry)
+
+    if workers <= 1:
+        for src_stream, src_path, zip_path in prefetch(reader):
+            yield task(src_stream, src_path, zip_path), src_path, zip_path
+        return
+
+    # No prefetch thread here: workers are forked, and the submission window already overlaps reads with conversion
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        for src_stream, src_path, zip_path in reader:
+            pending.append((executor.submit(task, src_stream, src_path, zip_path), src_path, zip_path))
+
+            if len(pending) >= workers * 2:
+                future, done_src_path, done_zip_path = pending.popleft()
+                yield future.result(), done_src_path, done_zip_path
+
+        while pending:
+            future, done_src_path, done_zip_path = pending.popleft()
+            yield future.result(), done_src_path, done_zip_path
 
 
 def convert_all(
     reader: Generator[tuple[BytesIO, Path, Path | None]],
-    parser: type[formats.base.FileModel],
+    parser: type[FileModel],
     router: dict[str, Path],
     dry: bool = True,
+    workers: int = 1,
 ) -> None:
-    for number, (src_stream, src_path, zip_path) in enumerate(reader, start=1):
-        instance = parser.model_validate_stream(src_stream)
+    results = convert_many(reader, parser, router, dry, workers)
 
-        try:
-            dst_stream, dst_suffix = instance.model_dump_stream()
-        except formats.base.FileIgnored:
+    for number, (dst_path, src_path, zip_path) in enumerate(results, start=1):
+        if dst_path is None:
             continue
 
-        dst_path = zip_path.joinpath(src_path).with_suffix(dst_suffix) if zip_path else src_path.with_suffix(dst_suffix)
-
-        for pattern, target_dir in router.items():
-            if dst_path.match(pattern):
-                dst_path = target_dir.joinpath(dst_path)
-                break
-
         if not zip_path:
             typer.echo(
                 f'Convert [{number:>05}]: "{typer.style(src_path.as_posix(), fg="green")}" '
@@ -39,7 +173,3 @@ def convert_all(
                 f'from "{typer.style(zip_path.as_posix(), fg="red")}" '
                 f'to "{typer.style(dst_path.as_posix(), fg="yellow")}"'
             )
-
-        if not dry:
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
-            dst_path.write_bytes(dst_stream.getvalue())
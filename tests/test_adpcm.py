@@ -0,0 +1,75 @@
+import random
+import struct
+
+import pytest
+
+from igipy.formats.utils import adpcm
+
+
+def decode_reference(data: bytes, channels: int = 1) -> bytes:
+    """Sample-by-sample decoder the table-driven one was rewritten from"""
+    if not data or channels < 1:
+        return b""
+
+    has_terminator = data[-1] == 0xAB  # noqa: PLR2004
+    data_to_decode = data[:-1] if has_terminator else data
+
+    states = [[0, 0] for _ in range(channels)]
+    decoded_samples = []
+
+    for nibble_index, code in enumerate(nibble for byte in data_to_decode for nibble in (byte >> 4, byte & 0x0F)):
+        state = states[nibble_index % channels]
+        predictor, step_index = state
+
+        step = adpcm.step_size_table[step_index]
+
+        reconstructed_diff = step >> 3
+        if code & 1:
+            reconstructed_diff += step >> 2
+        if code & 2:
+            reconstructed_diff += step >> 1
+        if code & 4:
+            reconstructed_diff += step
+
+        predictor = predictor - reconstructed_diff if code & 8 else predictor + reconstructed_diff
+        predictor = min(max(predictor, -32768), 32767)
+        decoded_samples.append(predictor)
+
+        state[:] = predictor, min(max(step_index + adpcm.index_table[code & 7], 0), 88)
+
+    if not has_terminator and decoded_samples:
+        decoded_samples.pop()
+
+    return struct.pack(f"<{len(decoded_samples)}h", *decoded_samples)
+
+
+@pytest.mark.parametrize("channels", [1, 2, 3])
+@pytest.mark.parametrize("terminator", [False, True])
+def test_decode_matches_reference(channels: int, terminator: bool) -> None:
+    rng = random.Random(f"{channels}{terminator}")
+
+    for size in [0, 1, 2, 3, 7, 64, 1001]:
+        data = bytes(rng.choice(range(0xAB)) for _ in range(size))
+        data += b"\xab" if terminator else b""
+
+        assert adpcm.decode(data, channels=channels) == decode_reference(data, channels=channels)
+
+
+@pytest.mark.parametrize("channels", [1, 2, 3])
+def test_decode_matches_reference_on_extremes(channels: int) -> None:
+    # Runs of the largest codes drive the predictor into both clamps and the step index to both ends
+    data = bytes([0x77] * 300 + [0xFF] * 600 + [0x00] * 300 + [0x88] * 50)
+
+    assert adpcm.decode(data, channels=channels) == decode_reference(data, channels=channels)
+    assert adpcm.decode(data + b"\xab", channels=channels) == decode_reference(data + b"\xab", channels=channels)
+
+
+@pytest.mark.parametrize("channels", [1, 2, 3])
+def test_decode_matches_reference_on_encoded(channels: int) -> None:
+    rng = random.Random(channels)
+
+    for frames in [1, 2, 5, 100]:
+        samples = [rng.randint(-32768, 32767) for _ in range(frames * channels)]
+        data = adpcm.encode(struct.pack(f"<{len(samples)}h", *samples), channels=channels)
+
+        assert adpcm.decode(data, channels=channels) == decode_reference(data, channels=channels)
@@ -0,0 +1,40 @@
+import random
+import string
+from pathlib import Path
+
+import pytest
+
+from igipy import cli
+
+
+def printable_reference(data: bytes, min_length: int, charset: str) -> str:
+    """Byte-by-byte implementation printable was rewritten from"""
+    output = ""
+    word = bytearray()
+
+    for byte in data:
+        if byte in charset.encode():
+            word.append(byte)
+        else:
+            if len(word) >= min_length:
+                output += word.decode() + "\n"
+            word.clear()
+
+    return output
+
+
+@pytest.mark.parametrize("charset", ["", "a", "ab", "]^-\\", "b\n", string.printable])
+@pytest.mark.parametrize("min_length", [-1, 0, 1, 2, 5])
+def test_printable_matches_reference(
+    tmp_path: Path, capsys: pytest.CaptureFixture, min_length: int, charset: str
+) -> None:
+    rng = random.Random(f"{min_length}{charset}")
+    src = tmp_path / "file.bin"
+
+    for _ in range(50):
+        data = bytes(rng.choice(b"ab]^-\\\x00\x01\n") for _ in range(rng.randint(0, 40)))
+        src.write_bytes(data)
+
+        cli.printable(src, min_length=min_length, charset=charset)
+
+        assert capsys.readouterr().out == printable_reference(data, min_length, charset)
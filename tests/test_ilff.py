@@ -0,0 +1,98 @@
+import struct
+from io import BytesIO
+
+import pytest
+
+from igipy.formats import res
+
+CHUNKS = [
+    (b"NAME", b"LOCAL:sounds/a.wav\x00"),
+    (b"BODY", b"abc"),
+    (b"NAME", b"LOCAL:sounds/b.wav\x00"),
+    (b"BODY", b""),
+    (b"NAME", b"paths\x00"),
+    (b"PATH", b"LOCAL:\x00"),
+]
+
+
+def padding(position: int, alignment: int) -> bytes:
+    return bytes((alignment - position % alignment) % alignment if alignment else 0)
+
+
+def build_ilff(chunks: list[tuple[bytes, bytes]], alignment: int, content_type: bytes = b"IRES") -> bytes:
+    data = bytearray(struct.pack("<4s3I", b"ILFF", 0, alignment, 0) + content_type)
+    data += padding(len(data), alignment)
+
+    for index, (fourcc, content) in enumerate(chunks):
+        start = len(data)
+        body = padding(start + 16, alignment) + content
+        body += padding(start + 16 + len(body), alignment)
+        offset = 0 if index == len(chunks) - 1 else 16 + len(body)
+        data += struct.pack("<4s3I", fourcc, len(content), alignment, offset) + body
+
+    return bytes(data)
+
+
+def chunk_starts(data: bytes, alignment: int) -> list[int]:
+    starts = [20 + len(padding(20, alignment))]
+
+    while offset := struct.unpack_from("<3I", data, starts[-1] + 4)[2]:
+        starts.append(starts[-1] + offset)
+
+    return starts
+
+
+@pytest.mark.parametrize("alignment", [0, 4, 32])
+def test_res_model_validate_stream(alignment: int) -> None:
+    data = build_ilff(CHUNKS, alignment)
+    stream = BytesIO(data)
+
+    model = res.RES.model_validate_stream(stream)
+
+    assert stream.tell() == len(data)
+    assert model.content_type == b"IRES"
+    assert [(name.content, body.content) for name, body in model.content_pairs] == [
+        (b"LOCAL:sounds/a.wav\x00", b"abc"),
+        (b"LOCAL:sounds/b.wav\x00", b""),
+    ]
+    assert model.content_paths[1].get_cleaned_content() == "LOCAL:"
+
+    chunks = [chunk for pair in [*model.content_pairs, model.content_paths] for chunk in pair]
+
+    assert [chunk.meta_start for chunk in chunks] == chunk_starts(data, alignment)
+    assert [chunk.meta_end for chunk in chunks] == [*chunk_starts(data, alignment)[1:], len(data)]
+
+
+def test_offset_mismatch() -> None:
+    data = bytearray(build_ilff(CHUNKS, 4))
+    start = chunk_starts(bytes(data), 4)[0]
+    offset = struct.unpack_from("<I", data, start + 12)[0]
+    struct.pack_into("<I", data, start + 12, offset + 4)
+
+    with pytest.raises(ValueError, match="Unexpected position"):
+        res.RES.model_validate_stream(BytesIO(bytes(data)))
+
+
+def test_trailing_data() -> None:
+    data = build_ilff(CHUNKS, 4) + b"\x00\x00\x00\x00"
+
+    with pytest.raises(ValueError, match="Expected end of stream"):
+        res.RES.model_validate_stream(BytesIO(data))
+
+
+def test_non_zero_padding() -> None:
+    data = bytearray(build_ilff(CHUNKS, 4))
+    start = chunk_starts(bytes(data), 4)[1]
+    data[start + 16 + 3] = 0xFF
+
+    with pytest.raises(ValueError, match="Unexpected padding"):
+        res.RES.model_validate_stream(BytesIO(bytes(data)))
+
+
+def test_short_padding() -> None:
+    data = build_ilff(CHUNKS, 32)
+
+    assert data[-16:] == bytes(16)
+
+    with pytest.raises(ValueError, match="Unexpected padding"):
+        res.RES.model_validate_stream(BytesIO(data[:-16]))
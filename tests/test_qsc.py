@@ -0,0 +1,35 @@
+import pytest
+
+from igipy.formats import qsc
+
+CALL = qsc.ExprStatement(expression=qsc.Call(function="f", arguments=[qsc.Literal(value=1)]))
+EMPTY = qsc.BlockStatement(statements=[])
+
+
+def block(*statements: qsc.Statement) -> qsc.BlockStatement:
+    return qsc.BlockStatement(statements=list(statements))
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (block(), b"\n"),
+        (block(CALL), b"f(1);\n"),
+        (block(EMPTY, CALL), b"\nf(1);\n"),
+        (block(CALL, EMPTY), b"f(1);\n"),
+        (block(CALL, EMPTY, EMPTY, CALL), b"f(1);\n\n\nf(1);\n"),
+        (
+            block(qsc.IfStatement(condition=qsc.Literal(value=1), then_block=block(EMPTY, CALL, EMPTY))),
+            b"if(1)\n{\n\n\tf(1);\n}\n",
+        ),
+        (
+            block(qsc.IfStatement(condition=qsc.Literal(value=1), then_block=block(), else_block=block(EMPTY, EMPTY))),
+            b"if(1)\n{\n}\nelse\n{\n\n}\n",
+        ),
+    ],
+)
+def test_model_dump_stream(content: qsc.BlockStatement, expected: bytes) -> None:
+    stream, suffix = qsc.QSC(content=content).model_dump_stream()
+
+    assert suffix == ".qsc"
+    assert stream.getvalue() == expected
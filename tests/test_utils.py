@@ -0,0 +1,195 @@
+import os
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from io import BytesIO
+from pathlib import Path
+from typing import Self
+
+import pytest
+
+from igipy import utils
+from igipy.formats.base import FileIgnored, FileModel
+
+TREE = ["a.res", "a.wav", "b/c.res", "b/d/e.res", "b/d/f.tex"]
+
+
+class EchoFile(FileModel):
+    content: bytes
+
+    @classmethod
+    def model_validate_stream(cls, stream: BytesIO) -> Self:
+        content = stream.read()
+
+        if content == b"broken":
+            raise ValueError("Broken file")
+
+        return cls(content=content)
+
+    def model_dump_stream(self) -> tuple[BytesIO, str]:
+        if self.content == b"ignored":
+            raise FileIgnored
+
+        return BytesIO(self.content.upper()), ".out"
+
+
+def make_tree(root: Path) -> None:
+    for path in TREE:
+        root.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+        root.joinpath(path).write_bytes(b"")
+
+    root.joinpath("g").mkdir()
+
+
+def make_reader(contents: list[bytes], consumed: list[int] | None = None) -> Iterator[tuple[BytesIO, Path, None]]:
+    for index, content in enumerate(contents):
+        if consumed is not None:
+            consumed.append(index)
+
+        yield BytesIO(content), Path(f"{index % 3}/{index}.in"), None
+
+
+def relative(root: Path, paths: list[str]) -> list[str]:
+    # Walk order is unspecified, so paths are compared sorted
+    return sorted(Path(path).relative_to(root).as_posix() for path in paths)
+
+
+def test_iter_files(tmp_path: Path) -> None:
+    make_tree(tmp_path)
+
+    paths = list(utils.iter_files(tmp_path))
+
+    assert all(isinstance(path, str) for path in paths)
+    assert relative(tmp_path, paths) == TREE
+
+
+def test_iter_files_suffix(tmp_path: Path) -> None:
+    make_tree(tmp_path)
+
+    assert relative(tmp_path, utils.iter_files(tmp_path, suffix=".res")) == ["a.res", "b/c.res", "b/d/e.res"]
+    assert relative(tmp_path, utils.iter_files(tmp_path, suffix=".qvm")) == []
+
+
+def test_iter_files_empty(tmp_path: Path) -> None:
+    assert list(utils.iter_files(tmp_path)) == []
+
+
+def test_iter_files_skips_symlinks(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    outside = tmp_path / "outside"
+    make_tree(root)
+    make_tree(outside)
+
+    try:
+        root.joinpath("link").symlink_to(outside, target_is_directory=True)
+        root.joinpath("link.res").symlink_to(outside / "a.res")
+    except OSError:
+        pytest.skip("Symlinks are not supported")
+
+    assert relative(root, utils.iter_files(root)) == TREE
+
+
+def test_compile_name_patterns() -> None:
+    name_regex = utils.compile_name_patterns(["**/*.res", "missions/**/text.qsc", "*.TEX"])
+
+    for name in ["a.res", "text.qsc", "b.TEX"]:
+        assert name_regex.match(os.path.normcase(name))
+
+    for name in ["a.res.bak", "ares", "context.qsc", "a.wav"]:
+        assert not name_regex.match(os.path.normcase(name))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_many(tmp_path: Path, workers: int) -> None:
+    contents = [f"file {index}".encode() for index in range(10)] + [b"ignored", b"last"]
+    dst_paths = [tmp_path / f"{index % 3}/{index}.out" for index in range(12)]
+
+    results = list(utils.convert_many(make_reader(contents), EchoFile, {"*": tmp_path}, dry=False, workers=workers))
+
+    assert [src_path for _, src_path, _ in results] == [Path(f"{index % 3}/{index}.in") for index in range(12)]
+    assert [dst_path for dst_path, _, _ in results] == [*dst_paths[:10], None, dst_paths[11]]
+    assert not dst_paths[10].exists()
+    assert [dst_paths[index].read_bytes() for index in [*range(10), 11]] == [
+        *[content.upper() for content in contents[:10]],
+        b"LAST",
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_many_error(workers: int) -> None:
+    results = utils.convert_many(make_reader([b"a", b"broken", b"c"]), EchoFile, {}, workers=workers)
+
+    with pytest.raises(ValueError, match="Broken file"):
+        list(results)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_many_after_output_removed(tmp_path: Path, workers: int) -> None:
+    contents = [b"a", b"b", b"c"]
+
+    for _ in range(2):
+        results = utils.convert_many(make_reader(contents), EchoFile, {"*": tmp_path}, dry=False, workers=workers)
+
+        assert [dst_path.read_bytes() for dst_path, _, _ in results] == [b"A", b"B", b"C"]
+
+        for path in tmp_path.iterdir():
+            shutil.rmtree(path)
+
+
+def test_convert_many_window() -> None:
+    workers = 2
+    consumed = []
+    results = utils.convert_many(make_reader([b"a"] * 20, consumed), EchoFile, {}, workers=workers)
+
+    next(results)
+
+    assert len(consumed) == workers * 2
+
+    results.close()
+
+
+def test_prefetch() -> None:
+    assert list(utils.prefetch(range(10))) == list(range(10))
+    assert list(utils.prefetch([])) == []
+
+
+def test_prefetch_error() -> None:
+    def produce() -> Iterator[int]:
+        yield 1
+        yield 2
+        raise ValueError("Broken reader")
+
+    items = utils.prefetch(produce())
+
+    assert next(items) == 1
+    assert next(items) == 2  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="Broken reader"):
+        next(items)
+
+
+def test_prefetch_close() -> None:
+    size = 2
+    produced = []
+
+    def produce() -> Iterator[int]:
+        for index in range(1000):
+            produced.append(index)
+            yield index
+
+    threads = set(threading.enumerate())
+    items = utils.prefetch(produce(), size=size)
+
+    assert next(items) == 0
+
+    # One item consumed, size items queued, and the producer waiting to put the next one
+    deadline = time.monotonic() + 5
+    while len(produced) < size + 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    items.close()
+
+    assert not set(threading.enumerate()) - threads
+
+    assert len(produced) == size + 2
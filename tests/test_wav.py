@@ -0,0 +1,50 @@
+import wave
+from io import BytesIO
+
+import pytest
+
+from igipy.formats import wav
+
+
+def dump_reference(model: wav.WAV) -> bytes:
+    """Dump samples through the wave module, which the hand-packed header replaced"""
+    stream = BytesIO()
+
+    with wave.open(stream, "w") as wave_stream:
+        wave_stream.setnchannels(model.header.channels)
+        wave_stream.setsampwidth(model.header.sample_width // 8)
+        wave_stream.setframerate(model.header.framerate)
+        wave_stream.writeframesraw(model.samples)
+
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("sound_pack", "channels", "framerate", "content"),
+    [
+        (0, 1, 22050, bytes(range(200))),
+        (1, 2, 44100, bytes(range(256)) * 3),
+        (0, 1, 11025, b""),
+        (0, 2, 22050, b""),
+        (0, 1, 22050, b"\x01\x02\x03"),
+        (1, 2, 44100, bytes(range(7))),
+        (3, 2, 22050, bytes(range(64)) + b"\xab"),
+        (2, 1, 11025, bytes(range(63))),
+    ],
+)
+def test_model_dump_stream_matches_wave_module(sound_pack: int, channels: int, framerate: int, content: bytes) -> None:
+    header = wav.WAVHeader(
+        signature=b"ILSF",
+        sound_pack=sound_pack,
+        sample_width=16,
+        channels=channels,
+        unknown=0,
+        framerate=framerate,
+        sample_count=0,
+    )
+    model = wav.WAV(header=header, content=content)
+
+    stream, suffix = model.model_dump_stream()
+
+    assert suffix == ".wav"
+    assert stream.getvalue() == dump_reference(model)